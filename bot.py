@@ -1,17 +1,29 @@
 import os
+import json
+import re
+import atexit
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-import time
-from datetime import datetime, date
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+from cachetools import TTLCache
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputMediaPhoto
+from telegram.error import BadRequest, TimedOut
 from telegram.ext import Updater, CommandHandler, MessageHandler, Filters, CallbackContext, CallbackQueryHandler
 from dotenv import load_dotenv
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 
 # Load environment variables
 load_dotenv()
@@ -26,16 +38,7 @@ logger = logging.getLogger(__name__)
 # Initialize Supabase with Anon Key (respects RLS)
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY')
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-# Custom function to set user context for RLS
-def set_user_context(telegram_id):
-    """Set the user context for RLS by calling a custom RPC function"""
-    try:
-        # This will call a PostgreSQL function that sets the current user
-        supabase.rpc("set_user_context", {"user_telegram_id": str(telegram_id)}).execute()
-    except Exception as e:
-        logger.error(f"Error setting user context: {e}")
+supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY, options=ClientOptions(postgrest_client_timeout=10))
 
 # Initialize database tables
 def init_db():
@@ -47,30 +50,15 @@ def init_db():
         logger.error(f"Database connection failed: {e}")
 
 def get_or_create_user(telegram_id, username=None, first_name=None, last_name=None):
+    """Create or touch the user in one round-trip, returning id, created_at and today_usage"""
     try:
-        # Set user context for RLS
-        set_user_context(telegram_id)
-        
-        # Check if user exists
-        response = supabase.table('users').select("*").eq('telegram_id', str(telegram_id)).execute()
-        
-        if len(response.data) == 0:
-            # Create new user
-            user_data = {
-                'telegram_id': str(telegram_id),
-                'username': username,
-                'first_name': first_name,
-                'last_name': last_name,
-                'is_premium': False,
-                'created_at': str(datetime.now()),
-                'last_active': str(datetime.now())
-            }
-            response = supabase.table('users').insert(user_data).execute()
-            return response.data[0] if response.data else None
-        else:
-            # Update last active
-            response = supabase.table('users').update({'last_active': str(datetime.now())}).eq('telegram_id', str(telegram_id)).execute()
-            return response.data[0] if response.data else None
+        response = supabase.rpc("upsert_user_with_usage", {
+            'p_telegram_id': str(telegram_id),
+            'p_username': username,
+            'p_first_name': first_name,
+            'p_last_name': last_name
+        }).execute()
+        return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Error in get_or_create_user: {e}")
         return None
@@ -81,44 +69,142 @@ def log_usage(user_id, post_url, image_count):
         usage_data = {
             'user_id': user_id,
             'post_url': post_url,
-            'image_count': image_count,
-            'created_at': str(datetime.now())
+            'image_count': image_count
         }
+        # created_at is filled in by Postgres (default now())
         response = supabase.table('usage_logs').insert(usage_data).execute()
         return response.data[0] if response.data else None
     except Exception as e:
         logger.error(f"Error in log_usage: {e}")
         return None
 
-def get_today_usage(user_id):
-    try:
-        today = date.today().isoformat()
-        
-        # Get start and end of today
-        today_start = f"{today}T00:00:00"
-        today_end = f"{today}T23:59:59"
-        
-        response = supabase.table('usage_logs').select("id"). \
-            eq('user_id', user_id). \
-            gte('created_at', today_start). \
-            lte('created_at', today_end).execute()
-        return len(response.data)
-    except Exception as e:
-        logger.error(f"Error in get_today_usage: {e}")
-        return 0
+# Shared HTTP session so outbound requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+
+# Upper bound for page load waits, and for each scroll to grow the page
+PAGE_LOAD_TIMEOUT = 15
+SCROLL_TIMEOUT = 2
+MAX_SCROLLS = 5
+
+# Page height and image count, used to tell whether a scroll loaded anything new
+PAGE_SIZE_JS = "return [document.body.scrollHeight, document.images.length];"
+
+# UI images to skip: profile photos (by page link and by CDN name, which covers
+# author/commenter avatars in the network log), company logos, vector icons,
+# sprites, logos, icons, emojis and reaction images
+EXCLUDE_RE = re.compile(
+    r"linkedin\.com/in/|profile-displayphoto|profile-framedphoto|/company-logo/|/vector/|sprite|logo|icon|emoji|reaction",
+    re.I
+)
+
+# Post images are served from LinkedIn's media CDN
+LICDN_RE = re.compile(r"^https://media(?:-exp\d+)?\.licdn\.com/dms/image/[^?]+")
+
+def prefer_post_images(images):
+    """Keep only LinkedIn CDN images, unless none match (e.g. after a layout change)"""
+    post_images = [src for src in images if LICDN_RE.match(src)]
+    return post_images or images
+
+# Images smaller than this in either dimension are treated as icons
+MIN_IMAGE_SIZE = 50
+
+# Keeps HTTP images that don't match the exclusion pattern (arguments[0]) and
+# aren't smaller than arguments[1]. Images are blocked from loading, so size
+# comes from the width/height attributes; images without both aren't judged
+FILTER_IMAGES_JS = """
+const re = new RegExp(arguments[0], 'i');
+const min = arguments[1];
+return Array.from(document.images)
+    .filter(i => i.src.startsWith('http') && !re.test(i.src))
+    .filter(i => {
+        const w = parseInt(i.getAttribute('width'), 10);
+        const h = parseInt(i.getAttribute('height'), 10);
+        return !(w && h) || (w >= min && h >= min);
+    })
+    .map(i => i.src);
+"""
+
+# Requests to block in Chrome: images (post images on the LinkedIn CDN have no
+# extension), stylesheets and fonts
+BLOCKED_URLS = [
+    "*.jpg", "*.jpeg", "*.png", "*.webp", "*.gif", "*.svg", "*/dms/image/*",
+    "*.css", "*.woff", "*.woff2"
+]
+
+# Recently scraped posts, keyed by normalized URL
+_URL_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_URL_CACHE_LOCK = threading.Lock()
+
+# Query parameters LinkedIn adds to shared links that don't change the post
+TRACKING_PARAMS = {'trk', 'trackingId', 'rcm', 'lipi', 'midToken', 'midSig', 'originalSubdomain'}
+
+def normalize_url(url):
+    """Strip tracking parameters and fragments so the same post maps to one cache key"""
+    parts = urlparse(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k not in TRACKING_PARAMS and not k.startswith('utm_')]
+    return urlunparse(parts._replace(netloc=parts.netloc.lower(), query=urlencode(query), fragment=''))
+
+def get_cached_images(cache_key):
+    """Return a copy of the cached image list for a normalized URL, or None"""
+    with _URL_CACHE_LOCK:
+        cached = _URL_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    logger.info(f"Cache hit for {cache_key}: {len(cached)} images")
+    return list(cached)
+
+def cache_images(cache_key, images):
+    """Remember the image list scraped for a normalized URL"""
+    with _URL_CACHE_LOCK:
+        _URL_CACHE[cache_key] = list(images)
+
+def _json_ld_images(data):
+    """Collect the post's own "image" URLs from a parsed JSON-LD document.
+
+    Only top-level objects (or @graph entries) are read; nested objects such as
+    author and comment carry profile photos, not post images.
+    """
+    if isinstance(data, dict) and '@graph' in data:
+        data = data['@graph']
+    found = []
+    for item in data if isinstance(data, list) else [data]:
+        if not isinstance(item, dict):
+            continue
+        value = item.get('image')
+        for image in value if isinstance(value, list) else [value]:
+            if isinstance(image, str):
+                found.append(image)
+            elif isinstance(image, dict):
+                found.append(image.get('url') or image.get('contentUrl'))
+    return found
+
+# Pinned ChromeDriver binary; when unset it is resolved once via webdriver-manager,
+# which touches disk/network on every install()
+CHROMEDRIVER_PATH = os.getenv('CHROMEDRIVER_PATH')
 
 # LinkedIn Scraper
 class LinkedInScraper:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-    
-    def extract_images(self, post_url):
-        """Extract images from LinkedIn post"""
-        try:
+    # Shared headless Chrome, reused across requests
+    _driver = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_driver(cls):
+        """Return the shared Chrome driver, starting it on first use"""
+        global CHROMEDRIVER_PATH
+        if cls._driver is None:
             options = Options()
+            # Return from driver.get() at DOMContentLoaded rather than waiting for every sub-resource
+            options.page_load_strategy = 'eager'
             options.add_argument('--headless')
             options.add_argument('--no-sandbox')
             options.add_argument('--disable-dev-shm-usage')
@@ -128,10 +214,92 @@ class LinkedInScraper:
             options.add_argument('--disable-blink-features=AutomationControlled')
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
+            # Record network events so requested image URLs can be read back
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
             
-            # Use webdriver-manager to automatically manage ChromeDriver
-            service = Service(ChromeDriverManager().install())
+            # Fall back to webdriver-manager to automatically manage ChromeDriver
+            if not CHROMEDRIVER_PATH:
+                CHROMEDRIVER_PATH = ChromeDriverManager().install()
+            service = Service(CHROMEDRIVER_PATH)
             driver = webdriver.Chrome(service=service, options=options)
+            # Don't let driver.get() hang for chromedriver's 300s default while holding the lock
+            driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+            
+            # Only image URLs are needed, so block image, CSS and font downloads at the
+            # network layer; blocked image requests still show up in the performance log
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+            
+            cls._driver = driver
+            logger.info("Chrome driver started")
+        return cls._driver
+
+    @classmethod
+    def quit_driver(cls):
+        """Shut down the shared Chrome driver"""
+        if cls._driver is not None:
+            try:
+                cls._driver.quit()
+            except Exception as e:
+                logger.error(f"Error quitting driver: {e}")
+            cls._driver = None
+
+    def extract_images_fast(self, post_url):
+        """Extract images from the post's OpenGraph and JSON-LD metadata without a browser"""
+        try:
+            response = SESSION.get(post_url, timeout=10)
+            response.raise_for_status()
+            soup = BeautifulSoup(response.text, 'lxml')
+            
+            images = [tag.get('content') for tag in soup.find_all('meta', property='og:image')]
+            for script in soup.find_all('script', type='application/ld+json'):
+                try:
+                    images.extend(_json_ld_images(json.loads(script.string or '')))
+                except ValueError:
+                    continue
+            
+            images = prefer_post_images([src for src in dict.fromkeys(images)
+                                         if src and src.startswith('http') and not EXCLUDE_RE.search(src)])
+            logger.info(f"Fast path extracted {len(images)} images from {post_url}")
+            return images
+            
+        except Exception as e:
+            logger.error(f"Error in extract_images_fast: {e}")
+            return []
+
+    def extract_images(self, post_url):
+        """Extract images from LinkedIn post"""
+        cache_key = normalize_url(post_url)
+        with self._lock:
+            # Another request may have scraped the same post while we waited
+            cached = get_cached_images(cache_key)
+            if cached is not None:
+                return cached
+            images = self._extract_images(post_url)
+            if images:
+                cache_images(cache_key, images)
+        return images
+
+    @staticmethod
+    def _network_image_urls(driver):
+        """Drain the performance log and return image URLs the page requested"""
+        urls = []
+        for entry in driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            params = message.get("params", {})
+            if message.get("method") == "Network.requestWillBeSent" and params.get("type") == "Image":
+                urls.append(params["request"]["url"])
+            elif message.get("method") == "Network.responseReceived" and \
+                    params.get("response", {}).get("mimeType", "").startswith("image/"):
+                urls.append(params["response"]["url"])
+        return [url for url in urls if url.startswith('http') and not EXCLUDE_RE.search(url)]
+
+    def _extract_images(self, post_url):
+        try:
+            driver = self.get_driver()
             
             # Execute script to avoid detection
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -139,118 +307,54 @@ class LinkedInScraper:
             images = []
             try:
                 logger.info(f"Loading URL: {post_url}")
-                driver.get(post_url)
-                time.sleep(8)  # Increased wait time
+                # Discard network events left over from the previous page
+                driver.get_log("performance")
+                try:
+                    driver.get(post_url)
+                    # One wait, so parsing and the first image share the same ceiling
+                    WebDriverWait(driver, PAGE_LOAD_TIMEOUT).until(
+                        lambda d: d.execute_script("return document.readyState") != "loading"
+                        and d.find_elements(By.CSS_SELECTOR, "img[src^='http']")
+                    )
+                except TimeoutException:
+                    logger.info(f"Timed out waiting for images after {PAGE_LOAD_TIMEOUT}s")
                 
-                # Scroll to load all content multiple times
-                for i in range(3):
+                # Scroll to load lazy content, stopping once neither the page height
+                # nor the number of images grows
+                for i in range(MAX_SCROLLS):
+                    before = driver.execute_script(PAGE_SIZE_JS)
                     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
-                
-                # Find image elements with multiple selectors
-                img_elements = driver.find_elements("tag name", "img")
-                logger.info(f"Found {len(img_elements)} image elements")
-                
-                # Debug: Log all image sources to understand the pattern
-                all_images_debug = []
-                for i, img in enumerate(img_elements):
                     try:
-                        src = img.get_attribute('src')
-                        alt = img.get_attribute('alt') or ''
-                        width = img.get_attribute('width') or '0'
-                        height = img.get_attribute('height') or '0'
-                        if src:
-                            logger.info(f"Image {i+1}: src={src[:150]}, alt={alt[:50]}, size={width}x{height}")
-                            all_images_debug.append(src)
-                    except Exception as e:
-                        logger.error(f"Error getting attributes for image {i+1}: {e}")
+                        WebDriverWait(driver, SCROLL_TIMEOUT).until(
+                            lambda d: any(now > then for now, then in zip(d.execute_script(PAGE_SIZE_JS), before))
+                        )
+                    except TimeoutException:
+                        break
                 
-                logger.info(f"Debug - Total images with src: {len(all_images_debug)}")
+                # Filter images in the browser so only candidates cross the WebDriver bridge
+                images = driver.execute_script(FILTER_IMAGES_JS, EXCLUDE_RE.pattern, MIN_IMAGE_SIZE)
+                logger.info(f"Found {len(images)} candidate images")
                 
-                # Try alternative approach - look for background images and other elements
-                try:
-                    # Check for div elements with background images
-                    all_elements = driver.find_elements("css selector", "*")
-                    logger.info(f"Found {len(all_elements)} total elements, checking for background images...")
-                    
-                    bg_images_found = 0
-                    for element in all_elements[:100]:  # Check first 100 elements
-                        try:
-                            style = element.get_attribute('style')
-                            if style and 'background-image' in style and 'url(' in style:
-                                bg_images_found += 1
-                                logger.info(f"Background image found in style: {style[:100]}")
-                        except:
-                            pass
-                    
-                    logger.info(f"Found {bg_images_found} elements with background images")
-                except Exception as e:
-                    logger.error(f"Error checking background images: {e}")
+                # Add images the page requested that aren't <img> tags (e.g. backgrounds)
+                network_images = self._network_image_urls(driver)
+                logger.info(f"Found {len(network_images)} images in network log")
+                images.extend(network_images)
                 
-                for i, img in enumerate(img_elements):
-                    try:
-                        src = img.get_attribute('src')
-                        alt = img.get_attribute('alt') or ''
-                        
-                        if not src or src.startswith('data:'):
-                            logger.info(f"Image {i+1}: Skipped - no src or data URL")
-                            continue
-                        
-                        # VERY AGGRESSIVE APPROACH - Include almost all images except obvious UI elements
-                        exclude_patterns = [
-                            'linkedin.com/in/',  # Profile photos
-                            '/company-logo/',    # Company logos
-                            '/vector/',          # Vector icons
-                            'sprite',            # Icon sprites
-                            'logo',              # Any logos
-                            'icon',              # Icons
-                            'emoji',             # Emojis
-                            'reaction',          # Reaction images
-                        ]
-                        
-                        # Skip only if it matches exclusion patterns
-                        should_exclude = any(pattern in src.lower() for pattern in exclude_patterns)
-                        
-                        if should_exclude:
-                            logger.info(f"Image {i+1}: Excluded - {src[:100]}")
-                            continue
-                        
-                        # Include if it's an HTTP image that doesn't match exclusions
-                        if src.startswith('http'):
-                            # Additional check for very small images (likely icons)
-                            try:
-                                width = img.get_attribute('width')
-                                height = img.get_attribute('height')
-                                
-                                if width and height:
-                                    w, h = int(width), int(height)
-                                    if w < 50 or h < 50:  # Skip very small images
-                                        logger.info(f"Image {i+1}: Skipped small image ({w}x{h}): {src[:100]}")
-                                        continue
-                            except:
-                                pass
-                            
-                            images.append(src)
-                            logger.info(f"Image {i+1}: ✅ ADDED - {src[:100]}...")
-                        else:
-                            logger.info(f"Image {i+1}: Skipped - not HTTP URL: {src[:100]}")
-                                
-                    except Exception as e:
-                        logger.error(f"Error processing image element {i+1}: {e}")
-                        continue
-                        
             except Exception as e:
                 logger.error(f"Selenium error: {e}")
-            finally:
-                driver.quit()
+                # Browser may have crashed; start a fresh one next time
+                self.quit_driver()
+            else:
+                # Reset state so the next request starts clean
+                try:
+                    driver.delete_all_cookies()
+                    driver.get("about:blank")
+                except Exception as e:
+                    logger.error(f"Error resetting driver: {e}")
+                    self.quit_driver()
             
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_images = []
-            for img in images:
-                if img not in seen:
-                    seen.add(img)
-                    unique_images.append(img)
+            # Remove duplicates while preserving order, keeping CDN post images if any
+            unique_images = prefer_post_images(list(dict.fromkeys(images)))
             
             logger.info(f"Extracted {len(unique_images)} unique images")
             return unique_images
@@ -259,6 +363,69 @@ class LinkedInScraper:
             logger.error(f"Error in extract_images: {e}")
             return []
 
+atexit.register(LinkedInScraper.quit_driver)
+
+# Shared pool for uploading photos to Telegram; 4 concurrent sends stays well
+# under the per-chat rate limit
+SEND_WORKERS = 4
+SEND_POOL = ThreadPoolExecutor(max_workers=SEND_WORKERS)
+
+def scrape_post(url):
+    """Extract images from the post's metadata, falling back to Chrome if it has nothing"""
+    cache_key = normalize_url(url)
+    cached = get_cached_images(cache_key)
+    if cached is not None:
+        return cached
+    
+    scraper = LinkedInScraper()
+    images = scraper.extract_images_fast(url)
+    if images:
+        cache_images(cache_key, images)
+        return images
+    return scraper.extract_images(url)
+
+# Threads handling Telegram updates
+DISPATCHER_WORKERS = 8
+
+# Telegram users with a link in progress; each user gets one at a time so the
+# daily limit is checked against an up-to-date count
+_ACTIVE_USERS = set()
+_ACTIVE_USERS_LOCK = threading.Lock()
+
+def try_start_user(telegram_id):
+    """Mark the user as busy, returning False if they already have a link in progress"""
+    with _ACTIVE_USERS_LOCK:
+        if telegram_id in _ACTIVE_USERS:
+            return False
+        _ACTIVE_USERS.add(telegram_id)
+        return True
+
+def finish_user(telegram_id):
+    """Mark the user's link as done"""
+    with _ACTIVE_USERS_LOCK:
+        _ACTIVE_USERS.discard(telegram_id)
+
+def send_image(bot, chat_id, image_url, index, total):
+    """Send one image, falling back to its direct link. Returns True if the photo was sent"""
+    try:
+        bot.send_photo(
+            chat_id=chat_id,
+            photo=image_url,
+            caption=f"🖼️ Image {index+1}/{total}"
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Error sending image {index+1}: {e}")
+        # Try sending the image URL as text if direct sending fails
+        try:
+            bot.send_message(
+                chat_id=chat_id,
+                text=f"📎 Image {index+1} (direct link):\n{image_url}"
+            )
+        except:
+            pass
+        return False
+
 # Bot Handlers
 def start(update: Update, context: CallbackContext):
     user = update.effective_user
@@ -327,7 +494,7 @@ def stats_callback(update: Update, context: CallbackContext):
     db_user = get_or_create_user(user.id)
     
     if db_user:
-        today_usage = get_today_usage(db_user['id'])
+        today_usage = db_user['today_usage']
         
         stats_text = f"""
 📊 *Your Stats*
@@ -373,6 +540,17 @@ Send me a LinkedIn post URL and I'll download all images for you!
     query.edit_message_text(welcome_message, parse_mode='Markdown', reply_markup=reply_markup)
 
 def handle_url(update: Update, context: CallbackContext):
+    # Handlers run concurrently; don't tie up a worker waiting on the same user's previous link
+    telegram_id = update.effective_user.id
+    if not try_start_user(telegram_id):
+        update.message.reply_text("⏳ Still working on your previous link...\n\nPlease send the next one when it's done.")
+        return
+    try:
+        process_url(update, context)
+    finally:
+        finish_user(telegram_id)
+
+def process_url(update: Update, context: CallbackContext):
     user = update.effective_user
     db_user = get_or_create_user(
         user.id, 
@@ -386,7 +564,7 @@ def handle_url(update: Update, context: CallbackContext):
         return
     
     # Check daily limit
-    today_usage = get_today_usage(db_user['id'])
+    today_usage = db_user['today_usage']
     if today_usage >= 5:
         update.message.reply_text("❌ You've reached your daily limit of 5 downloads!\n\nCome back tomorrow or wait for premium features! 🚀")
         return
@@ -402,9 +580,8 @@ def handle_url(update: Update, context: CallbackContext):
     processing_msg = update.message.reply_text("🔍 Processing your LinkedIn post...\n\nThis may take 15-30 seconds...")
     
     try:
-        # Extract images
-        scraper = LinkedInScraper()
-        images = scraper.extract_images(url)
+        # Try the post's embedded metadata first; only fall back to Chrome if it has nothing
+        images = scrape_post(url)
         
         if not images:
             processing_msg.edit_text("❌ No images found in this LinkedIn post!\n\n💡 *Possible reasons:*\n• Post has no images\n• Post is private/restricted\n• Images failed to load\n\nTry with a different public post!")
@@ -420,27 +597,41 @@ def handle_url(update: Update, context: CallbackContext):
         success_count = 0
         failed_count = 0
         
-        for i, image_url in enumerate(images):
+        # Albums need at least 2 photos; a single call delivers up to 10
+        send_single = len(images) == 1
+        if not send_single:
             try:
-                context.bot.send_photo(
-                    chat_id=update.effective_chat.id,
-                    photo=image_url,
-                    caption=f"🖼️ Image {i+1}/{len(images)}"
-                )
-                success_count += 1
-                time.sleep(1)  # Increased delay to prevent rate limiting
+                media = [
+                    InputMediaPhoto(media=image_url, caption=f"🖼️ {len(images)} images" if i == 0 else None)
+                    for i, image_url in enumerate(images)
+                ]
+                messages = context.bot.send_media_group(chat_id=update.effective_chat.id, media=media)
+                success_count = len(messages)
+            except BadRequest as e:
+                # Telegram rejected the album, e.g. one URL is unreachable
+                logger.error(f"Error sending album, falling back to single photos: {e}")
+                send_single = True
+            except TimedOut:
+                # Telegram fetches every URL itself, so big albums often outlive the
+                # client timeout but still arrive; re-sending would duplicate them
+                logger.info("Timed out sending album, assuming it was delivered")
+                success_count = len(images)
             except Exception as e:
-                logger.error(f"Error sending image {i+1}: {e}")
-                failed_count += 1
-                # Try sending the image URL as text if direct sending fails
-                try:
-                    context.bot.send_message(
-                        chat_id=update.effective_chat.id,
-                        text=f"📎 Image {i+1} (direct link):\n{image_url}"
-                    )
-                except:
-                    pass
-                continue
+                # Delivery is unknown; don't risk sending everything twice
+                logger.error(f"Error sending album: {e}")
+                failed_count = len(images)
+        
+        # Send photos one by one if there is only one or Telegram rejected the album
+        if send_single:
+            futures = [
+                SEND_POOL.submit(send_image, context.bot, update.effective_chat.id, image_url, i, len(images))
+                for i, image_url in enumerate(images)
+            ]
+            for future in as_completed(futures):
+                if future.result():
+                    success_count += 1
+                else:
+                    failed_count += 1
         
         # Log usage only if at least one image was processed
         if success_count > 0 or failed_count > 0:
@@ -475,7 +666,13 @@ def main():
         return
     
     # Create updater and dispatcher
-    updater = Updater(token, use_context=True)
+    # Size the bot's connection pool for dispatcher workers, photo senders and polling
+    updater = Updater(
+        token,
+        use_context=True,
+        workers=DISPATCHER_WORKERS,
+        request_kwargs={'con_pool_size': DISPATCHER_WORKERS + SEND_WORKERS + 4}
+    )
     dp = updater.dispatcher
     
     # Add handlers
@@ -484,11 +681,18 @@ def main():
     dp.add_handler(CallbackQueryHandler(stats_callback, pattern="^stats$"))
     dp.add_handler(CallbackQueryHandler(back_to_main_callback, pattern="^back_to_main$"))
     dp.add_handler(CallbackQueryHandler(help_command, pattern="^help$"))
-    dp.add_handler(MessageHandler(Filters.text & ~Filters.command, handle_url))
+    # Run URL handling on the worker pool so a slow scrape doesn't hold up other updates
+    dp.add_handler(MessageHandler(Filters.text & ~Filters.command, handle_url, run_async=True))
     
     # Add error handler
     dp.add_error_handler(error_handler)
     
+    # Start the shared browser up front so the first request doesn't pay for it
+    try:
+        LinkedInScraper.get_driver()
+    except Exception as e:
+        logger.error(f"Error starting Chrome driver: {e}")
+    
     # Start the bot
     logger.info("Starting LinkedIn Image Downloader Bot...")
     updater.start_polling()